@@ -1,7 +1,7 @@
 import asyncio
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import List, Optional
+from typing import Dict, Optional, Sequence
 
 from temporalio import workflow
 from temporalio.exceptions import ApplicationError
@@ -11,17 +11,17 @@ with workflow.unsafe.imports_passed_through():
     from message_passing.introduction.activities import call_greeting_service
 
 
-@dataclass
+@dataclass(slots=True)
 class GetLanguagesInput:
     include_unsupported: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class SetLanguageInput:
     language: Language
 
 
-@dataclass
+@dataclass(slots=True)
 class ApproveInput:
     name: str
 
@@ -43,6 +43,9 @@ class GreetingWorkflow:
     translations which are not available in local workflow state.
     """
 
+    # Queries may be sent many times, so we avoid re-sorting on every call.
+    _ALL_LANGUAGES_SORTED = tuple(sorted(Language))
+
     def __init__(self) -> None:
         self.approved_for_release = False
         self.approver_name: Optional[str] = None
@@ -50,8 +53,10 @@ class GreetingWorkflow:
             Language.CHINESE: "你好，世界",
             Language.ENGLISH: "Hello, world",
         }
+        self._refresh_supported()
         self.language = Language.ENGLISH
         self.lock = asyncio.Lock()  # used by the async handler below
+        self._greeting_fetches: Dict[Language, asyncio.Task[None]] = {}
 
     @workflow.run
     async def run(self) -> str:
@@ -65,12 +70,12 @@ class GreetingWorkflow:
         return self.greetings[self.language]
 
     @workflow.query
-    def get_languages(self, input: GetLanguagesInput) -> List[Language]:
+    def get_languages(self, input: GetLanguagesInput) -> Sequence[Language]:
         # 👉 A Query handler returns a value: it can inspect but must not mutate the Workflow state.
         if input.include_unsupported:
-            return sorted(Language)
+            return self._ALL_LANGUAGES_SORTED
         else:
-            return sorted(self.greetings)
+            return self._supported_sorted
 
     @workflow.signal
     def approve(self, input: ApproveInput) -> None:
@@ -86,39 +91,65 @@ class GreetingWorkflow:
 
     @set_language.validator
     def validate_language(self, input: SetLanguageInput) -> None:
-        if input.language not in self.greetings:
+        if input.language not in self._supported_set:
             # 👉 In an Update validator you raise any exception to reject the Update.
             raise ValueError(f"{input.language.name} is not supported")
 
     @workflow.update
     async def set_language_using_activity(self, input: SetLanguageInput) -> Language:
         # 👉 This update handler is async, so it can execute an activity.
-        if input.language not in self.greetings:
-            # 👉 We use a lock so that, if this handler is executed multiple
-            # times, each execution can schedule the activity only when the
-            # previously scheduled activity has completed. This ensures that
-            # multiple calls to set_language are processed in order.
-            async with self.lock:
-                greeting = await workflow.execute_activity(
-                    call_greeting_service,
-                    input.language,
-                    start_to_close_timeout=timedelta(seconds=10),
+        fetch = None
+        if input.language not in self._supported_set:
+            # 👉 If this handler is executed multiple times for the same
+            # language while the activity is still running, every execution
+            # awaits the same fetch rather than scheduling a duplicate
+            # activity.
+            fetch = self._greeting_fetches.get(input.language)
+            if fetch is None:
+                fetch = asyncio.create_task(self._fetch_greeting(input.language))
+                self._greeting_fetches[input.language] = fetch
+        # 👉 We use a lock so that, if this handler is executed multiple times,
+        # the language changes are applied in the order the updates were
+        # accepted, even if a later fetch completes first: asyncio.Lock is
+        # acquired in FIFO order. Every call takes the lock, including calls for
+        # languages that are already supported, so such a call waits for any
+        # earlier call that is still fetching rather than being overwritten by
+        # it. The fetch was started before waiting for the lock, so fetches for
+        # different languages still run concurrently, rather than one at a time
+        # as they would if the lock were held around the activity.
+        async with self.lock:
+            if fetch is not None:
+                await fetch
+            previous_language, self.language = self.language, input.language
+            return previous_language
+
+    async def _fetch_greeting(self, language: Language) -> None:
+        try:
+            greeting = await workflow.execute_activity(
+                call_greeting_service,
+                language,
+                start_to_close_timeout=timedelta(seconds=10),
+            )
+            # 👉 The requested language might not be supported by the remote
+            # service. If so, we raise ApplicationError, which will fail the
+            # Update. The WorkflowExecutionUpdateAccepted event will still be
+            # added to history. (Update validators can be used to reject updates
+            # before any event is written to history, but they cannot be async,
+            # and so we cannot use an update validator for this purpose.)
+            if greeting is None:
+                raise ApplicationError(
+                    f"Greeting service does not support {language.name}"
                 )
-                # 👉 The requested language might not be supported by the remote
-                # service. If so, we raise ApplicationError, which will fail the
-                # Update. The WorkflowExecutionUpdateAccepted event will still
-                # be added to history. (Update validators can be used to reject
-                # updates before any event is written to history, but they
-                # cannot be async, and so we cannot use an update validator for
-                # this purpose.)
-                if greeting is None:
-                    raise ApplicationError(
-                        f"Greeting service does not support {input.language.name}"
-                    )
-                self.greetings[input.language] = greeting
-        previous_language, self.language = self.language, input.language
-        return previous_language
+            self.greetings[language] = greeting
+            self._refresh_supported()
+        finally:
+            del self._greeting_fetches[language]
 
     @workflow.query
     def get_language(self) -> Language:
         return self.language
+
+    def _refresh_supported(self) -> None:
+        # Must be called whenever self.greetings changes.
+        self._supported_set = frozenset(self.greetings)
+        self._supported_sorted = tuple(sorted(self.greetings))
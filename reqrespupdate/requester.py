@@ -1,4 +1,6 @@
 import asyncio
+import random
+from typing import Optional
 
 from temporalio.client import Client, WorkflowUpdateFailedError
 from temporalio.envconfig import ClientConfig
@@ -7,23 +9,35 @@ from temporalio.exceptions import ApplicationError
 from reqrespupdate import WORKFLOW_ID
 from reqrespupdate.workflow import BACKOFF_ERROR_TYPE, Request, UppercaseWorkflow
 
+INITIAL_BACKOFF = 0.25
+MAX_BACKOFF = 1.0
 
-async def main():
-    config = ClientConfig.load_client_connect_config()
-    config.setdefault("target_host", "localhost:7233")
-    client = await Client.connect(**config)
+
+def jittered(delay: float) -> float:
+    # Jitter within the cap, so a retry never waits longer than MAX_BACKOFF.
+    return min(delay * random.uniform(1, 1.5), MAX_BACKOFF)
+
+
+async def main(client: Optional[Client] = None):
+    if client is None:
+        config = ClientConfig.load_client_connect_config()
+        config.setdefault("target_host", "localhost:7233")
+        client = await Client.connect(**config)
     handle = client.get_workflow_handle(WORKFLOW_ID)
 
     # Request an uppercasing every second. Several of these can be run at once,
     # in separate terminals, to confirm the requesters are independent of each
     # other.
     i = 0
+    backoff = INITIAL_BACKOFF
     while True:
         request = Request(input=f"foo{i}")
         try:
             response = await handle.execute_update(UppercaseWorkflow.uppercase, request)
             print(f"Requested uppercase of {request.input}, got {response.output}")
             i += 1
+            backoff = INITIAL_BACKOFF
+            await asyncio.sleep(1)
         except WorkflowUpdateFailedError as err:
             # The run we sent to is draining toward a continue-as-new and asked
             # us to back off. Retrying sends to the same workflow ID, which by
@@ -35,7 +49,11 @@ async def main():
                 print("Rejected while the workflow continues as new, retrying")
             else:
                 raise
-        await asyncio.sleep(1)
+            # Every rejected request still costs the draining run a workflow
+            # task, so back off exponentially while it finishes its in-flight
+            # requests. Jitter keeps several requesters from retrying in step.
+            await asyncio.sleep(jittered(backoff))
+            backoff = min(backoff * 2, MAX_BACKOFF)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import asyncio
+from typing import Optional
 
 from temporalio.client import Client
 from temporalio.envconfig import ClientConfig
@@ -7,10 +8,11 @@ from reqrespupdate import TASK_QUEUE, WORKFLOW_ID
 from reqrespupdate.workflow import UppercaseWorkflow, UppercaseWorkflowInput
 
 
-async def main():
-    config = ClientConfig.load_client_connect_config()
-    config.setdefault("target_host", "localhost:7233")
-    client = await Client.connect(**config)
+async def main(client: Optional[Client] = None):
+    if client is None:
+        config = ClientConfig.load_client_connect_config()
+        config.setdefault("target_host", "localhost:7233")
+        client = await Client.connect(**config)
 
     handle = await client.start_workflow(
         UppercaseWorkflow.run,
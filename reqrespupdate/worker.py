@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from typing import Optional
 
 from temporalio.client import Client
 from temporalio.envconfig import ClientConfig
@@ -12,10 +13,11 @@ from reqrespupdate.workflow import UppercaseWorkflow
 interrupt_event = asyncio.Event()
 
 
-async def main():
-    config = ClientConfig.load_client_connect_config()
-    config.setdefault("target_host", "localhost:7233")
-    client = await Client.connect(**config)
+async def main(client: Optional[Client] = None):
+    if client is None:
+        config = ClientConfig.load_client_connect_config()
+        config.setdefault("target_host", "localhost:7233")
+        client = await Client.connect(**config)
 
     async with Worker(
         client,
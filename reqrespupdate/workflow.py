@@ -18,17 +18,17 @@ BACKOFF_ERROR_TYPE = "ContinuingAsNew"
 # Be in the habit of storing message inputs and outputs in serializable
 # structures. This makes it easier to add more over time in a
 # backward-compatible way.
-@dataclass
+@dataclass(slots=True)
 class Request:
     input: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     output: str
 
 
-@dataclass
+@dataclass(slots=True)
 class UppercaseWorkflowInput:
     # Workflows cannot have infinitely-sized history, so a workflow that fields
     # requests forever has to continue-as-new periodically. We bound the number
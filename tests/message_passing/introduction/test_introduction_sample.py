@@ -1,7 +1,10 @@
+import asyncio
 import uuid
+from typing import List, Optional
 
 import pytest
-from temporalio.client import Client, WorkflowUpdateFailedError
+from temporalio import activity
+from temporalio.client import Client, WorkflowUpdateFailedError, WorkflowUpdateStage
 from temporalio.testing import WorkflowEnvironment
 from temporalio.worker import Worker
 
@@ -123,3 +126,142 @@ async def test_set_language_that_is_only_available_via_remote_service(
         )
         assert previous_language == Language.ENGLISH
         assert await wf_handle.query(GreetingWorkflow.get_language) == Language.ARABIC
+        assert await wf_handle.query(
+            GreetingWorkflow.get_languages, GetLanguagesInput(include_unsupported=False)
+        ) == [Language.ARABIC, Language.CHINESE, Language.ENGLISH]
+
+
+async def test_concurrent_updates_for_one_language_share_one_activity(
+    client: Client, env: WorkflowEnvironment
+):
+    if env.supports_time_skipping:
+        pytest.skip(
+            "Java test server: https://github.com/temporalio/sdk-java/issues/1903"
+        )
+    calls: List[Language] = []
+    # Held until both updates are accepted, so the second one is guaranteed to
+    # find the first fetch still in flight.
+    release = asyncio.Event()
+
+    @activity.defn(name="call_greeting_service")
+    async def counting_greeting_service(to_language: Language) -> Optional[str]:
+        calls.append(to_language)
+        await release.wait()
+        return f"Greeting in {to_language.name}"
+
+    async with Worker(
+        client,
+        task_queue=TASK_QUEUE,
+        workflows=[GreetingWorkflow],
+        activities=[counting_greeting_service],
+    ):
+        wf_handle = await client.start_workflow(
+            GreetingWorkflow.run,
+            id=str(uuid.uuid4()),
+            task_queue=TASK_QUEUE,
+        )
+        update_handles = [
+            await wf_handle.start_update(
+                GreetingWorkflow.set_language_using_activity,
+                SetLanguageInput(language=Language.ARABIC),
+                wait_for_stage=WorkflowUpdateStage.ACCEPTED,
+            )
+            for _ in range(2)
+        ]
+        release.set()
+        assert await update_handles[0].result() == Language.ENGLISH
+        assert await update_handles[1].result() == Language.ARABIC
+        assert calls == [Language.ARABIC]
+
+
+async def test_failed_fetch_can_be_retried(client: Client, env: WorkflowEnvironment):
+    if env.supports_time_skipping:
+        pytest.skip(
+            "Java test server: https://github.com/temporalio/sdk-java/issues/1903"
+        )
+    calls: List[Language] = []
+
+    @activity.defn(name="call_greeting_service")
+    async def flaky_greeting_service(to_language: Language) -> Optional[str]:
+        calls.append(to_language)
+        # The language is unsupported on the first call only.
+        return None if len(calls) == 1 else f"Greeting in {to_language.name}"
+
+    async with Worker(
+        client,
+        task_queue=TASK_QUEUE,
+        workflows=[GreetingWorkflow],
+        activities=[flaky_greeting_service],
+    ):
+        wf_handle = await client.start_workflow(
+            GreetingWorkflow.run,
+            id=str(uuid.uuid4()),
+            task_queue=TASK_QUEUE,
+        )
+        with pytest.raises(WorkflowUpdateFailedError):
+            await wf_handle.execute_update(
+                GreetingWorkflow.set_language_using_activity,
+                SetLanguageInput(language=Language.FRENCH),
+            )
+        assert await wf_handle.query(GreetingWorkflow.get_language) == Language.ENGLISH
+
+        previous_language = await wf_handle.execute_update(
+            GreetingWorkflow.set_language_using_activity,
+            SetLanguageInput(language=Language.FRENCH),
+        )
+        assert previous_language == Language.ENGLISH
+        assert await wf_handle.query(GreetingWorkflow.get_language) == Language.FRENCH
+        assert calls == [Language.FRENCH, Language.FRENCH]
+
+
+async def test_language_updates_apply_in_accepted_order(
+    client: Client, env: WorkflowEnvironment
+):
+    if env.supports_time_skipping:
+        pytest.skip(
+            "Java test server: https://github.com/temporalio/sdk-java/issues/1903"
+        )
+    # The Arabic fetch is accepted first but held until the French fetch has
+    # completed.
+    release_arabic = asyncio.Event()
+
+    @activity.defn(name="call_greeting_service")
+    async def gated_greeting_service(to_language: Language) -> Optional[str]:
+        if to_language == Language.ARABIC:
+            await release_arabic.wait()
+        return f"Greeting in {to_language.name}"
+
+    async with Worker(
+        client,
+        task_queue=TASK_QUEUE,
+        workflows=[GreetingWorkflow],
+        activities=[gated_greeting_service],
+    ):
+        wf_handle = await client.start_workflow(
+            GreetingWorkflow.run,
+            id=str(uuid.uuid4()),
+            task_queue=TASK_QUEUE,
+        )
+        arabic_handle = await wf_handle.start_update(
+            GreetingWorkflow.set_language_using_activity,
+            SetLanguageInput(language=Language.ARABIC),
+            wait_for_stage=WorkflowUpdateStage.ACCEPTED,
+        )
+        french_handle = await wf_handle.start_update(
+            GreetingWorkflow.set_language_using_activity,
+            SetLanguageInput(language=Language.FRENCH),
+            wait_for_stage=WorkflowUpdateStage.ACCEPTED,
+        )
+        # Wait until the workflow has recorded the French greeting. The French
+        # update must still not have been applied, because the Arabic update
+        # was accepted before it.
+        while Language.FRENCH not in await wf_handle.query(
+            GreetingWorkflow.get_languages, GetLanguagesInput(include_unsupported=False)
+        ):
+            await asyncio.sleep(0.1)
+        assert await wf_handle.query(GreetingWorkflow.get_language) == Language.ENGLISH
+        release_arabic.set()
+
+        assert await arabic_handle.result() == Language.ENGLISH
+        assert await french_handle.result() == Language.ARABIC
+        assert await wf_handle.query(GreetingWorkflow.get_language) == Language.FRENCH
@@ -8,6 +8,7 @@ from temporalio.testing import WorkflowEnvironment
 from temporalio.worker import Worker
 
 from reqrespupdate.activities import uppercase
+from reqrespupdate.requester import INITIAL_BACKOFF, MAX_BACKOFF, jittered
 from reqrespupdate.workflow import (
     BACKOFF_ERROR_TYPE,
     Request,
@@ -101,3 +102,12 @@ async def test_continues_as_new_without_losing_requests(
             assert description.run_id != handle.first_execution_run_id
         finally:
             await handle.terminate()
+
+
+def test_jittered_backoff_stays_within_cap():
+    backoff = INITIAL_BACKOFF
+    for _ in range(10):
+        for _ in range(100):
+            delay = jittered(backoff)
+            assert backoff <= delay <= MAX_BACKOFF
+        backoff = min(backoff * 2, MAX_BACKOFF)